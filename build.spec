@@ -12,7 +12,6 @@ a = Analysis(
         'ttkbootstrap',
         'pikepdf',
         'reportlab',
-        'pdf2image',
     ],
     hookspath=[],
     runtime_hooks=[],
@@ -4,25 +4,29 @@ from tkinter import ttk
 import ttkbootstrap as tb
 from ttkbootstrap.constants import *
 import pikepdf
-from reportlab.pdfgen import canvas as rl_canvas
 from reportlab.lib.pagesizes import letter, A4, A5, legal
 from reportlab.lib.units import inch
-import io
+from reportlab.pdfbase.pdfmetrics import stringWidth
 import threading
 import math
 import os
 import re
-from collections import deque
 import traceback
-from pdf2image import convert_from_path
+from concurrent.futures import ThreadPoolExecutor
+from itertools import chain
 
 # --- BACKEND PDF PROCESSING LOGIC ---
 
+# Separators allowed between the parts of a page range, e.g. '1-5, 8 10-12'
+_RANGE_SPLIT = re.compile(r'[,\s]+')
+
 class PdfProcessor:
     """Handles all the backend PDF manipulation tasks."""
 
-    def __init__(self, file_paths, options, progress_callback, status_callback):
-        self.file_paths = file_paths
+    def __init__(self, files, options, progress_callback, status_callback):
+        # Each entry is a dict with the file's 'path' and its page count under 'pages',
+        # which lets the merge skip inputs that lie past the requested page range
+        self.files = files
         self.options = options
         self.progress_callback = progress_callback
         self.status_callback = status_callback
@@ -32,54 +36,50 @@ class PdfProcessor:
             "Letter": letter,
             "Legal": legal
         }
+        # (page width, page height, target rect) -> (placement rect, scale), filled by _place_page
+        self._placements = {}
 
     def create_booklet(self):
         """Main method to orchestrate the booklet creation process."""
+        self._opened_pdfs = []
         try:
             self.status_callback("Starting booklet creation...")
             self.progress_callback(5)
 
             # 1. Merge PDFs if multiple are provided
             self.status_callback("Merging PDF files...")
-            merged_pdf_path = self._merge_pdfs()
-            if not merged_pdf_path:
+            source_pdf = self._merge_pdfs()
+            if source_pdf is None:
                 raise Exception("Failed to merge PDFs.")
             self.progress_callback(20)
 
-            # 2. Open the merged PDF
-            with pikepdf.open(merged_pdf_path) as source_pdf:
-                # 3. Parse page range
-                pages_to_process = self._parse_page_range(len(source_pdf.pages))
-                if not pages_to_process:
-                    raise ValueError("Invalid page range specified.")
-                
-                # 4. Handle splitting
-                self.status_callback("Organizing pages for booklet layout...")
-                booklet_chunks = self._split_into_booklets(pages_to_process)
-                self.progress_callback(40)
-
-                output_files = []
-                total_chunks = len(booklet_chunks)
-
-                for i, chunk in enumerate(booklet_chunks):
-                    chunk_status = f"Processing booklet {i+1} of {total_chunks}..."
-                    self.status_callback(chunk_status)
-                    
-                    # 5. Reorder pages for booklet layout
-                    ordered_pages_indices = self._reorder_for_booklet(chunk)
-                    
-                    # 6. Create the final output PDF
-                    output_pdf = self._create_final_pdf(source_pdf, ordered_pages_indices)
-                    
-                    # 7. Save the output
-                    base_path, extension = os.path.splitext(self.options['output_path'])
-                    output_filename = f"{base_path}_part_{i+1}{extension}" if total_chunks > 1 else self.options['output_path']
-                    output_pdf.save(output_filename)
-                    output_pdf.close()
-                    output_files.append(output_filename)
-                    
-                    progress = 40 + int(60 * (i + 1) / total_chunks)
-                    self.progress_callback(progress)
+            # 2. Parse page range
+            pages_to_process = self._parse_page_range(len(source_pdf.pages))
+            if not pages_to_process:
+                raise ValueError("Invalid page range specified.")
+
+            # 3. Handle splitting
+            self.status_callback("Organizing pages for booklet layout...")
+            booklet_chunks = self._split_into_booklets(pages_to_process)
+            self.progress_callback(40)
+
+            output_files = []
+            total_chunks = len(booklet_chunks)
+            base_path, extension = os.path.splitext(self.options['output_path'])
+
+            for i, chunk in enumerate(booklet_chunks):
+                chunk_status = f"Processing booklet {i+1} of {total_chunks}..."
+                self.status_callback(chunk_status)
+
+                # 4. Reorder pages for booklet layout
+                ordered_pages_indices = self._reorder_for_booklet(chunk)
+
+                # 5. Create and save the final output PDF
+                output_filename = f"{base_path}_part_{i+1}{extension}" if total_chunks > 1 else self.options['output_path']
+                output_files.append(self._create_final_pdf(source_pdf, ordered_pages_indices, output_filename))
+
+                progress = 40 + int(60 * (i + 1) / total_chunks)
+                self.progress_callback(progress)
 
             self.status_callback(f"Booklet(s) created successfully: {', '.join(output_files)}")
 
@@ -89,37 +89,46 @@ class PdfProcessor:
             self.status_callback(f"Error: {e}")
             return False
         finally:
-            # Clean up temporary merged file
-            if hasattr(self, '_temp_merged_file') and os.path.exists(self._temp_merged_file):
-                os.remove(self._temp_merged_file)
+            # Close every PDF opened for this run
+            for pdf in self._opened_pdfs:
+                pdf.close()
         
         return True
 
     def _merge_pdfs(self):
-        """Merges multiple PDFs into a single temporary file."""
-        if not self.file_paths:
+        """Merges the input PDFs into a single in-memory pikepdf.Pdf."""
+        if not self.files:
             return None
-        if len(self.file_paths) == 1:
-            # If only one file, check for password and return its path
-            try:
-                with pikepdf.open(self.file_paths[0], password=self.options.get('password', '')):
-                    return self.file_paths[0]
-            except pikepdf.PasswordError:
-                raise Exception(f"Incorrect password for {os.path.basename(self.file_paths[0])}")
+        if len(self.files) == 1:
+            # If only one file, use it directly
+            entry = self.files[0]
+            return self._open_entry(entry)
+
+        # Pages after the last one in the requested range are never used, so only copy the
+        # pages up to it. Dropping only the tail keeps the indices of the remaining pages unchanged.
+        # The page counts read when the files were added tell us this before opening any of them,
+        # so inputs that lie entirely past the range are never opened at all.
+        pages_to_process = self._parse_page_range(sum(entry['pages'] for entry in self.files))
+        remaining = pages_to_process[-1] + 1 if pages_to_process else 0
 
         merged_pdf = pikepdf.Pdf.new()
-        for path in self.file_paths:
-            try:
-                with pikepdf.open(path, password=self.options.get('password', '')) as pdf:
-                    merged_pdf.pages.extend(pdf.pages)
-            except pikepdf.PasswordError:
-                raise Exception(f"Incorrect password for {os.path.basename(path)}")
-        
-        # Save to a temporary file
-        self._temp_merged_file = "temp_merged_booklet.pdf"
-        merged_pdf.save(self._temp_merged_file)
-        merged_pdf.close()
-        return self._temp_merged_file
+        self._opened_pdfs.append(merged_pdf)
+        for entry in self.files:
+            if remaining <= 0:
+                break
+            merged_pdf.pages.extend(self._open_entry(entry).pages[:remaining])
+            remaining -= entry['pages']
+
+        return merged_pdf
+
+    def _open_entry(self, entry):
+        """Opens an input entry for this run, checking its password."""
+        try:
+            pdf = pikepdf.open(entry['path'], password=self.options.get('password', ''))
+        except pikepdf.PasswordError:
+            raise Exception(f"Incorrect password for {os.path.basename(entry['path'])}")
+        self._opened_pdfs.append(pdf)
+        return pdf
 
     def _parse_page_range(self, total_pages):
         """Parses a page range string (e.g., '1-5, 8, 10-12') into a list of indices."""
@@ -127,20 +136,16 @@ class PdfProcessor:
         if not range_str:
             return list(range(total_pages))
 
-        indices = set()
-        parts = re.split(r'[,\s]+', range_str)
-        for part in parts:
+        # Collect each part as an inclusive (start, end) range, clipped to the document
+        ranges = []
+        for part in _RANGE_SPLIT.split(range_str):
             if not part: continue
             if '-' in part:
                 start, end = map(int, part.split('-'))
-                for i in range(start, end + 1):
-                    if 1 <= i <= total_pages:
-                        indices.add(i - 1)
             else:
-                i = int(part)
-                if 1 <= i <= total_pages:
-                    indices.add(i - 1)
-        return sorted(list(indices))
+                start = end = int(part)
+            ranges.append((max(start, 1), min(end, total_pages)))
+        return sorted(set(chain.from_iterable(range(start - 1, end) for start, end in ranges)))
 
     def _split_into_booklets(self, page_indices):
         """Splits the list of page indices into smaller chunks for separate booklets."""
@@ -165,33 +170,27 @@ class PdfProcessor:
         padded_indices = page_indices + [-1] * padding
         n = len(padded_indices)
         
-        reordered = []
-        
-        # Use a deque for efficient popping from both ends
-        page_deque = deque(padded_indices)
-
         is_rtl = self.options.get('direction', 'LTR') == 'RTL'
 
-        while page_deque:
-            if is_rtl:
-                # For RTL: front-left, front-right, back-left, back-right
-                reordered.append(page_deque.popleft())  # 1
-                reordered.append(page_deque.pop())      # n
-                if page_deque:
-                    reordered.append(page_deque.pop())      # n-1
-                    reordered.append(page_deque.popleft())  # 2
-            else: # LTR
-                # For LTR: front-left, front-right, back-left, back-right
-                reordered.append(page_deque.pop())      # n
-                reordered.append(page_deque.popleft())  # 1
-                if page_deque:
-                    reordered.append(page_deque.popleft())  # 2
-                    reordered.append(page_deque.pop())      # n-1
+        # Sheet s holds pages (2s, 2s+1) from the front and (n-1-2s, n-2-2s) from the back,
+        # so each of the four positions on a sheet is one strided slice of the padded list
+        half = n // 2
+        from_back = padded_indices[::-1]
+        first, second = padded_indices[:half:2], padded_indices[1:half:2]
+        last, second_last = from_back[:half:2], from_back[1:half:2]
+
+        reordered = [-1] * n
+        if is_rtl:
+            # For RTL: front-left, front-right, back-left, back-right
+            reordered[0::4], reordered[1::4], reordered[2::4], reordered[3::4] = first, last, second_last, second
+        else: # LTR
+            # For LTR: front-left, front-right, back-left, back-right
+            reordered[0::4], reordered[1::4], reordered[2::4], reordered[3::4] = last, first, second, second_last
 
         return reordered
 
-    def _create_final_pdf(self, source_pdf, ordered_indices):
-        """Creates the final 2-up PDF booklet using reportlab and pdf2image, preserving aspect ratio and centering images."""
+    def _create_final_pdf(self, source_pdf, ordered_indices, output_filename):
+        """Creates the final 2-up PDF booklet by placing the source pages as vector Form XObjects, and writes it to output_filename."""
         # اختيار حجم الصفحة حسب الاتجاه
         base_size = self.paper_sizes.get(self.options['paper_size'], A4)
         if self.options.get('orientation', 'Portrait') == 'Landscape':
@@ -199,89 +198,87 @@ class PdfProcessor:
         else:
             output_size = base_size
         output_width, output_height = output_size
-        packet = io.BytesIO()
-        can = rl_canvas.Canvas(packet, pagesize=output_size)
-
-        temp_pdf_path = self._temp_merged_file if hasattr(self, '_temp_merged_file') else self.file_paths[0]
-        images = convert_from_path(temp_pdf_path, dpi=300)
+        left_half = pikepdf.Rectangle(0, 0, output_width / 2, output_height)
+        right_half = pikepdf.Rectangle(output_width / 2, 0, output_width, output_height)
 
+        output_pdf = pikepdf.Pdf.new()
         for i in range(0, len(ordered_indices), 2):
             left_idx = ordered_indices[i]
             right_idx = ordered_indices[i+1] if i+1 < len(ordered_indices) else -1
 
+            sheet = output_pdf.add_blank_page(page_size=output_size)
             # رسم الصفحة اليسرى في منتصف النصف الأيسر
-            if left_idx != -1:
-                img_left = images[left_idx]
-                orig_w, orig_h = img_left.size
-                max_w, max_h = output_width / 2 * 0.9, output_height * 0.9  # استخدم 90% من نصف الصفحة كحد أقصى
-                scale = min(max_w / orig_w, max_h / orig_h, 1.0)
-                new_w, new_h = int(orig_w * scale), int(orig_h * scale)
-                x_left = (output_width / 2 - new_w) / 2
-                y_left = (output_height - new_h) / 2
-                can.drawInlineImage(img_left, x_left, y_left, width=new_w, height=new_h)
-
+            self._place_page(source_pdf, left_idx, sheet, left_half)
             # رسم الصفحة اليمنى في منتصف النصف الأيمن
-            if right_idx != -1:
-                img_right = images[right_idx]
-                orig_w, orig_h = img_right.size
-                max_w, max_h = output_width / 2 * 0.9, output_height * 0.9
-                scale = min(max_w / orig_w, max_h / orig_h, 1.0)
-                new_w, new_h = int(orig_w * scale), int(orig_h * scale)
-                x_right = output_width / 2 + (output_width / 2 - new_w) / 2
-                y_right = (output_height - new_h) / 2
-                can.drawInlineImage(img_right, x_right, y_right, width=new_w, height=new_h)
-
-            can.showPage()
-
-        can.save()
-        packet.seek(0)
-        output_pdf = pikepdf.open(packet)
-        return output_pdf
+            self._place_page(source_pdf, right_idx, sheet, right_half)
+
+        # Pack the many small per-sheet objects into compressed object streams
+        output_pdf.save(
+            output_filename,
+            stream_decode_level=pikepdf.StreamDecodeLevel.generalized,
+            object_stream_mode=pikepdf.ObjectStreamMode.generate,
+        )
+        output_pdf.close()
+        return output_filename
 
     def _place_page(self, source_pdf, page_idx, target_page, target_rect):
-        """Places a source page onto a target page within a specified rectangle."""
+        """Places a source page onto a target page, centered within a specified rectangle."""
         if page_idx == -1:
             # Skip blank pages
             return
         source_page = source_pdf.pages[page_idx]
-        media_box = source_page.MediaBox
-        src_width = float(media_box[2]) - float(media_box[0])
-        src_height = float(media_box[3]) - float(media_box[1])
-        
-        # Handle page rotation
+        page_form = source_page.as_form_xobject()
+        # The form is clipped to the page's visible box and already carries its /Rotate, so its
+        # BBox mapped through its Matrix is exactly the area that ends up drawn
+        form_matrix = pikepdf.Matrix(page_form.Matrix) if pikepdf.Name.Matrix in page_form else pikepdf.Matrix()
+        drawn_box = form_matrix.transform(pikepdf.Rectangle(*page_form.BBox))
+        src_width, src_height = drawn_box.width, drawn_box.height
+
+        # Handle page rotation without touching the source page itself
         if src_width > src_height: # Landscape
-            source_page.rotate(90, relative=True)
+            page_form.Matrix = (form_matrix @ pikepdf.Matrix(0, -1, 1, 0, 0, 0)).as_array()
+            src_width, src_height = src_height, src_width
+
+        # Pages in a document usually share one size, so the geometry is computed once per size and slot
+        key = (src_width, src_height, target_rect.llx, target_rect.lly, target_rect.urx, target_rect.ury)
+        if key not in self._placements:
+            self._placements[key] = self._compute_placement(src_width, src_height, target_rect)
+        placement, scale = self._placements[key]
+
+        target_page.add_overlay(page_form, placement)
 
         # Add page numbers if enabled
         if self.options.get('add_page_numbers', False):
             page_num_to_display = page_idx + 1
-            overlay_pdf_bytes = self._create_page_number_overlay(
-                (src_width, src_height), 
-                page_num_to_display
-            )
-            overlay_pdf = pikepdf.open(io.BytesIO(overlay_pdf_bytes))
-            source_page.add_overlay(overlay_pdf.pages[0])
-
-        # استخدم overlay لإضافة الصفحة الأصلية إلى الصفحة الجديدة
-        target_page.add_overlay(source_page)
-        # ملاحظة: هذا سيضع الصفحة الأصلية فوق الصفحة الجديدة بالكامل
-        # إذا أردت وضعها في نصف الصفحة، تحتاج إلى معالجة إضافية بمكتبة أخرى
-
-        # إذا أردت فقط معالجة مكان الصفحة، يجب استخدام مكتبة أخرى مثل PyPDF2 أو fitz (PyMuPDF)
-
-    def _create_page_number_overlay(self, page_size, page_number):
-        """Creates a temporary PDF with just a page number."""
-        packet = io.BytesIO()
-        can = rl_canvas.Canvas(packet, pagesize=page_size)
-        width, height = page_size
-        
-        # Position at bottom center
-        can.setFont("Helvetica", 9)
-        can.drawCentredString(width / 2, 0.25 * inch, str(page_number))
-        can.save()
-        
-        packet.seek(0)
-        return packet.read()
+            self._draw_page_number(target_page, placement, scale, page_num_to_display)
+
+    @staticmethod
+    def _compute_placement(src_width, src_height, target_rect):
+        """Returns the (rectangle, scale) that fits a page of the given size, centered, within target_rect."""
+        # استخدم 90% من نصف الصفحة كحد أقصى مع الحفاظ على نسبة الأبعاد
+        max_w, max_h = target_rect.width * 0.9, target_rect.height * 0.9
+        # The old 300 DPI raster could only be shrunk in pixels, i.e. enlarged up to 300/72 in points
+        scale = min(max_w / src_width, max_h / src_height, 300 / 72)
+        new_w, new_h = src_width * scale, src_height * scale
+        x = target_rect.llx + (target_rect.width - new_w) / 2
+        y = target_rect.lly + (target_rect.height - new_h) / 2
+        return pikepdf.Rectangle(x, y, x + new_w, y + new_h), scale
+
+    def _draw_page_number(self, target_page, placement, scale, page_number):
+        """Writes a page number at the bottom center of a placed page, directly into the sheet's content stream."""
+        font_name = target_page.add_resource(
+            pikepdf.Dictionary(Type=pikepdf.Name.Font, Subtype=pikepdf.Name.Type1, BaseFont=pikepdf.Name.Helvetica),
+            pikepdf.Name.Font,
+            pikepdf.Name.PageNumberFont,
+        )
+        # 9pt Helvetica, 0.25 inch above the bottom edge, scaled with the page
+        text = str(page_number)
+        font_size = 9 * scale
+        x = placement.llx + placement.width / 2 - stringWidth(text, "Helvetica", font_size) / 2
+        y = placement.lly + 0.25 * inch * scale
+        target_page.contents_add(
+            f"q BT {font_name} {font_size:.4f} Tf {x:.4f} {y:.4f} Td ({text}) Tj ET Q\n".encode("ascii")
+        )
 
 
 # --- GUI APPLICATION ---
@@ -289,12 +286,23 @@ class PdfProcessor:
 class BookletCreatorApp:
     """The main GUI application class."""
 
+    _PROBE_STATUS = "Reading PDF files..."
+
     def __init__(self, root):
         self.root = root
         self.root.title("Booklet Creator")
         self.root.geometry("800x650")
-
-        self.file_paths = []
+        self.root.protocol("WM_DELETE_WINDOW", self._on_close)
+
+        # One dict per input: {'path': ..., 'pages': ...}
+        self.files = []
+        # Latest values reported by the processing thread, drawn by _flush_gui
+        self._pending_progress = None
+        self._pending_status = None
+        self._gui_timer = None
+        # Set once the window is being destroyed, so background threads stop calling into Tk
+        self._closed = False
+        self._status_before_probe = None
         self._setup_ui()
         self._update_ui_state()
 
@@ -327,7 +335,8 @@ class BookletCreatorApp:
         file_button_frame = tb.Frame(file_frame)
         file_button_frame.pack(fill=X, pady=(10, 0))
         
-        tb.Button(file_button_frame, text="Add PDF(s)", command=self._add_files, bootstyle=SUCCESS).pack(side=LEFT, padx=(0, 5))
+        self.add_btn = tb.Button(file_button_frame, text="Add PDF(s)", command=self._add_files, bootstyle=SUCCESS)
+        self.add_btn.pack(side=LEFT, padx=(0, 5))
         self.remove_btn = tb.Button(file_button_frame, text="Remove Selected", command=self._remove_selected_file, bootstyle=DANGER)
         self.remove_btn.pack(side=LEFT, padx=5)
         self.move_up_btn = tb.Button(file_button_frame, text="Move Up", command=lambda: self._move_item(-1))
@@ -404,24 +413,68 @@ class BookletCreatorApp:
         self.progress_bar.pack(fill=X, expand=YES, side=RIGHT)
 
     def _add_files(self):
-        """Opens file dialog to select PDFs and adds them to the list."""
+        """Opens file dialog to select PDFs and reads them in the background."""
         paths = filedialog.askopenfilenames(
             title="Select PDF files",
             filetypes=[("PDF Files", "*.pdf")]
         )
-        if paths:
-            for path in paths:
-                if path not in self.file_paths:
-                    try:
-                        with pikepdf.open(path) as pdf:
-                            pages = len(pdf.pages)
-                        self.file_paths.append(path)
-                        self.file_tree.insert("", END, values=(os.path.basename(path), pages))
-                    except pikepdf.PasswordError:
-                        messagebox.showwarning("Password Protected", f"{os.path.basename(path)} is password protected. Password handling is not yet implemented in this GUI version.")
-                    except Exception as e:
-                        messagebox.showerror("Error", f"Could not open {os.path.basename(path)}: {e}")
-            self._update_ui_state()
+        known_paths = {entry['path'] for entry in self.files}
+        new_paths = [path for path in dict.fromkeys(paths) if path not in known_paths]
+        if not new_paths:
+            return
+
+        # Opening large PDFs can take a while, so keep it off the Tk event loop
+        self.add_btn.config(state=DISABLED)
+        self._status_before_probe = self.status_var.get()
+        self.status_var.set(self._PROBE_STATUS)
+        thread = threading.Thread(target=self._probe_files, args=(new_paths,))
+        thread.daemon = True
+        thread.start()
+
+    def _probe_files(self, paths):
+        """Reads the given PDFs in parallel and hands each result back to the GUI thread."""
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            for path, result in zip(paths, executor.map(self._probe_pdf, paths)):
+                self._post_to_gui(self._insert_file, path, result)
+        self._post_to_gui(self._finish_adding_files)
+
+    def _post_to_gui(self, callback, *args):
+        """Queues a callback on the Tk event loop from a worker thread, unless the window is gone."""
+        if self._closed:
+            return
+        try:
+            self.root.after(0, callback, *args)
+        except (RuntimeError, tk.TclError):
+            # The window was destroyed between the check and the call
+            pass
+
+    @staticmethod
+    def _probe_pdf(path):
+        """Returns a PDF's page count, or the exception raised while opening it."""
+        try:
+            # Closed straight away so the file isn't held open (and locked on Windows)
+            with pikepdf.open(path) as pdf:
+                return len(pdf.pages)
+        except Exception as e:
+            return e
+
+    def _insert_file(self, path, result):
+        """Adds a probed PDF to the list, or reports why it couldn't be opened."""
+        if isinstance(result, pikepdf.PasswordError):
+            messagebox.showwarning("Password Protected", f"{os.path.basename(path)} is password protected. Password handling is not yet implemented in this GUI version.")
+        elif isinstance(result, Exception):
+            messagebox.showerror("Error", f"Could not open {os.path.basename(path)}: {result}")
+        else:
+            self.files.append({'path': path, 'pages': result})
+            self.file_tree.insert("", END, values=(os.path.basename(path), result))
+
+    def _finish_adding_files(self):
+        """Re-enables the Add button once all selected files have been read."""
+        self.add_btn.config(state=NORMAL)
+        # Put back whatever was shown before, unless a run has reported something newer meanwhile
+        if self.status_var.get() == self._PROBE_STATUS:
+            self.status_var.set(self._status_before_probe)
+        self._update_ui_state()
 
     def _remove_selected_file(self):
         """Removes the selected file from the list."""
@@ -431,7 +484,7 @@ class BookletCreatorApp:
         
         for item in selected_items:
             index = self.file_tree.index(item)
-            self.file_paths.pop(index)
+            self.files.pop(index)
             self.file_tree.delete(item)
         
         self._update_ui_state()
@@ -444,15 +497,15 @@ class BookletCreatorApp:
 
         for item in selected:
             self.file_tree.move(item, self.file_tree.parent(item), self.file_tree.index(item) + direction)
-            # Also update the underlying file_paths list
+            # Also update the underlying files list
             idx = self.file_tree.index(item)
-            path = self.file_paths.pop(idx - direction)
-            self.file_paths.insert(idx, path)
+            entry = self.files.pop(idx - direction)
+            self.files.insert(idx, entry)
 
 
     def _clear_all(self):
         """Resets the application to its initial state."""
-        self.file_paths.clear()
+        self.files.clear()
         for i in self.file_tree.get_children():
             self.file_tree.delete(i)
         
@@ -467,9 +520,14 @@ class BookletCreatorApp:
         self._toggle_split_options()
         self._update_ui_state()
 
+    def _on_close(self):
+        """Marks the app as closed before destroying the window."""
+        self._closed = True
+        self.root.destroy()
+
     def _update_ui_state(self):
         """Enables or disables widgets based on the current state."""
-        has_files = len(self.file_paths) > 0
+        has_files = len(self.files) > 0
         self.create_btn.config(state=NORMAL if has_files else DISABLED)
         self.remove_btn.config(state=NORMAL if has_files else DISABLED)
         self.move_up_btn.config(state=NORMAL if has_files else DISABLED)
@@ -481,16 +539,33 @@ class BookletCreatorApp:
         self.split_spinbox.config(state=state)
 
     def _update_progress(self, value):
-        self.progress_bar['value'] = value
-        self.root.update_idletasks()
+        """Records the latest progress value; it is shown on the next GUI flush."""
+        self._pending_progress = value
+        self._post_to_gui(self._schedule_flush)
 
     def _update_status(self, message):
-        self.status_var.set(message)
-        self.root.update_idletasks()
+        """Records the latest status message; it is shown on the next GUI flush."""
+        self._pending_status = message
+        self._post_to_gui(self._schedule_flush)
+
+    def _schedule_flush(self):
+        """Schedules a single GUI refresh so updates are drawn at most ~30 times a second."""
+        if self._gui_timer is None:
+            self._gui_timer = self.root.after(33, self._flush_gui)
+
+    def _flush_gui(self):
+        """Applies the most recent progress value and status message."""
+        self._gui_timer = None
+        # The values are left in place rather than cleared: the processing thread may write a newer
+        # one while they are being applied, and clearing afterwards would drop it. Re-applying is harmless.
+        if self._pending_progress is not None:
+            self.progress_bar['value'] = self._pending_progress
+        if self._pending_status is not None:
+            self.status_var.set(self._pending_status)
         
     def _start_booklet_creation(self):
         """Gathers options and starts the PDF processing in a new thread."""
-        if not self.file_paths:
+        if not self.files:
             messagebox.showwarning("No Files", "Please add at least one PDF file.")
             return
 
@@ -514,29 +589,32 @@ class BookletCreatorApp:
             'orientation': self.orientation_var.get(),
         }
 
-        # Reorder file_paths based on Treeview order
+        # Reorder files based on Treeview order
         tree_items = self.file_tree.get_children()
         ordered_filenames = [self.file_tree.item(item)['values'][0] for item in tree_items]
         
-        # Create a map of basename to full path for reordering
-        path_map = {os.path.basename(p): p for p in self.file_paths}
-        ordered_paths = [path_map[fname] for fname in ordered_filenames]
-        self.file_paths = ordered_paths
+        # Create a map of basename to file entry for reordering
+        entry_map = {os.path.basename(entry['path']): entry for entry in self.files}
+        self.files = [entry_map[fname] for fname in ordered_filenames]
 
         self.create_btn.config(state=DISABLED)
         self.progress_bar['value'] = 0
+        # Forget the previous run's values before the new processing thread starts reporting
+        self._pending_progress = None
+        self._pending_status = None
 
         # Run the PDF processing in a separate thread to avoid freezing the GUI
         thread = threading.Thread(
             target=self._run_processor,
-            args=(self.file_paths, options)
+            # A copy, so editing the list during a run doesn't affect it
+            args=(list(self.files), options)
         )
         thread.daemon = True
         thread.start()
 
-    def _run_processor(self, file_paths, options):
+    def _run_processor(self, files, options):
         """The target function for the processing thread."""
-        processor = PdfProcessor(file_paths, options, self._update_progress, self._update_status)
+        processor = PdfProcessor(files, options, self._update_progress, self._update_status)
         success = processor.create_booklet()
         
         if success: